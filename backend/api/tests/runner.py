@@ -0,0 +1,45 @@
+import os
+
+from django.apps import apps
+from django.db.models.signals import post_migrate
+from django.test.utils import override_settings
+from xmlrunner.extra.djangotestrunner import XMLTestRunner
+
+from roles.tests.utils import create_default_roles
+
+
+def create_default_roles_after_migrate(sender, **kwargs):
+    create_default_roles()
+
+
+class TestRunner(XMLTestRunner):
+    """Runs the tests with the default roles seeded into the test database.
+
+    The roles are created by a post_migrate handler. They are part of the database
+    before it is cloned for parallel runs, and they are restored after a flush.
+    Sessions are kept in signed cookies, so logging in does not write to the database.
+    In parallel runs each worker is limited to one BLAS thread, so the processes
+    that load pandas/numpy do not oversubscribe the cores.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.parallel > 1:
+            os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.session_settings = override_settings(SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies")
+        self.session_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.session_settings.disable()
+        super().teardown_test_environment(**kwargs)
+
+    def setup_databases(self, **kwargs):
+        post_migrate.connect(
+            create_default_roles_after_migrate,
+            sender=apps.get_app_config("roles"),
+            dispatch_uid="create_default_roles_after_migrate",
+        )
+        return super().setup_databases(**kwargs)
@@ -2,11 +2,13 @@ from unittest.mock import MagicMock
 
 from django.contrib.auth import get_user_model
 from django.core.management import CommandError
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
+from .utils import FAST_PASSWORD_HASHERS
 from api.management.commands.create_admin import Command
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class TestCreateAdminCommand(TestCase):
     def test_can_create_user(self):
         mock_out = MagicMock()
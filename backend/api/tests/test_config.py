@@ -2,12 +2,12 @@ from contextlib import contextmanager
 from importlib import reload
 from os import environ
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 from config.settings import base as settings
 
 
-class TestDatabaseUrl(TestCase):
+class TestDatabaseUrl(SimpleTestCase):
     def test_sslmode_defaults_to_required(self):
         with setenv("DATABASE_URL", "pgsql://u:p@h/d"):
             self._assert_sslmode_is("require")
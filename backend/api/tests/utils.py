@@ -1,8 +1,19 @@
-from typing import Any, Dict
+import functools
+import pathlib
+from typing import Any, Dict, Union
 
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+# Password hashing has no value in tests, and the default PBKDF2 hasher is slow on purpose.
+FAST_PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+@functools.lru_cache(maxsize=None)
+def read_test_file(file_path: Union[str, pathlib.Path]) -> bytes:
+    with open(file_path, "rb") as f:
+        return f.read()
+
 
 class CRUDMixin(APITestCase):
     url = ""
@@ -10,28 +21,28 @@ class CRUDMixin(APITestCase):
 
     def assert_fetch(self, user=None, expected=status.HTTP_403_FORBIDDEN):
         if user:
-            self.client.force_login(user)
+            self.client.force_authenticate(user)
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, expected)
         return response
 
     def assert_create(self, user=None, expected=status.HTTP_403_FORBIDDEN):
         if user:
-            self.client.force_login(user)
+            self.client.force_authenticate(user)
         response = self.client.post(self.url, data=self.data, format="json")
         self.assertEqual(response.status_code, expected)
         return response
 
     def assert_update(self, user=None, expected=status.HTTP_403_FORBIDDEN):
         if user:
-            self.client.force_login(user)
+            self.client.force_authenticate(user)
         response = self.client.patch(self.url, data=self.data, format="json")
         self.assertEqual(response.status_code, expected)
         return response
 
     def assert_delete(self, user=None, expected=status.HTTP_403_FORBIDDEN, data=None):
         if user:
-            self.client.force_login(user)
+            self.client.force_authenticate(user)
 
         if data is None:
             data = {}
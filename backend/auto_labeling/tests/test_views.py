@@ -18,9 +18,10 @@ data_dir = pathlib.Path(__file__).parent / "data"
 
 
 class TestTemplateList(CRUDMixin):
-    def setUp(self):
-        self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
-        self.url = reverse(viewname="auto_labeling_templates", args=[self.project.item.id])
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
+        cls.url = reverse(viewname="auto_labeling_templates", args=[cls.project.item.id])
 
     def test_allow_admin_to_fetch_template_list(self):
         self.url += "?task_name=DocumentClassification"
@@ -182,7 +182,7 @@ USE_L10N = True
 USE_TZ = True
 
 # Testing
-TEST_RUNNER = "xmlrunner.extra.djangotestrunner.XMLTestRunner"
+TEST_RUNNER = "api.tests.runner.TestRunner"
 TEST_OUTPUT_DIR = path.join(BASE_DIR, "junitxml")
 
 LOGIN_URL = "/login/"
@@ -206,6 +206,10 @@ DATABASES["default"].update(
     )
 )
 
+# Create the test database from the current models instead of replaying every migration.
+# Set DATABASE_TEST_MIGRATE=True to run the migrations for the test database as well.
+DATABASES["default"]["TEST"] = {"MIGRATE": env.bool("DATABASE_TEST_MIGRATE", False)}
+
 # work-around for dj-database-url: explicitly disable ssl for sqlite
 if DATABASES["default"].get("ENGINE") == "django.db.backends.sqlite3":
     DATABASES["default"].get("OPTIONS", {}).pop("sslmode", None)
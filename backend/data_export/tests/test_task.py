@@ -2,7 +2,7 @@ import os
 import zipfile
 
 import pandas as pd
-from django.test import TestCase, override_settings
+from django.test import TestCase, override_settings, tag
 from model_mommy import mommy
 
 from ..celery_tasks import export_dataset
@@ -25,6 +25,7 @@ def read_zip_content(file):
     return datasets
 
 
+@tag("slow")
 @override_settings(MEDIA_URL=os.path.dirname(__file__))
 class TestExport(TestCase):
     def export_dataset(self, confirmed_only=False):
@@ -7,9 +7,10 @@ from projects.tests.utils import prepare_project
 
 
 class TestDownloadCatalog(CRUDMixin):
-    def setUp(self):
-        self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
-        self.url = reverse(viewname="download-format", args=[self.project.item.id])
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
+        cls.url = reverse(viewname="download-format", args=[cls.project.item.id])
 
     def test_allows_project_admin_to_list_catalog(self):
         response = self.assert_fetch(self.project.admin, status.HTTP_200_OK)
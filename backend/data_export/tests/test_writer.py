@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 import unittest
 
 import pandas as pd
@@ -8,6 +10,16 @@ from ..pipeline.writers import CsvWriter, FastTextWriter, JsonlWriter, JsonWrite
 
 
 class TestWriter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.test_dir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.test_dir)
+        super().tearDownClass()
+
     def setUp(self):
         self.dataset = pd.DataFrame(
             [
@@ -16,10 +28,7 @@ class TestWriter(unittest.TestCase):
                 {"id": 2, "text": "C"},
             ]
         )
-        self.file = "tmp.csv"
-
-    def tearDown(self):
-        os.remove(self.file)
+        self.file = os.path.join(self.test_dir, "tmp.csv")
 
 
 class TestCSVWriter(TestWriter):
@@ -46,13 +55,13 @@ class TestJsonlWriter(TestWriter):
         assert_frame_equal(self.dataset, loaded_dataset)
 
 
-class TestFastText(unittest.TestCase):
+class TestFastText(TestWriter):
     def setUp(self):
         self.expected = "__label__A exampleA\n__label__B exampleB"
         self.dataset = pd.DataFrame([*zip(self.expected.split("\n"))])
 
     def test_write(self):
-        file = "tmp.txt"
+        file = os.path.join(self.test_dir, "tmp.txt")
         writer = FastTextWriter()
         writer.write(file, self.dataset)
         loaded_dataset = open(file, encoding="utf-8").read().strip()
@@ -9,12 +9,16 @@ from data_import.pipeline.readers import LINE_NUMBER_COLUMN
 
 
 class TestParser(unittest.TestCase):
-    def setUp(self):
-        self.test_dir = tempfile.mkdtemp()
-        self.test_file = os.path.join(self.test_dir, "test_file.csv")
-
-    def tearDown(self):
-        shutil.rmtree(self.test_dir)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.test_dir = tempfile.mkdtemp()
+        cls.test_file = os.path.join(cls.test_dir, "test_file.csv")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.test_dir)
+        super().tearDownClass()
 
     def create_file(self, content):
         with open(self.test_file, "w") as f:
@@ -2,11 +2,12 @@ import os
 import pathlib
 import shutil
 
-from django.core.files import File
-from django.test import TestCase, override_settings
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings, tag
 from django_drf_filepond.models import StoredUpload, TemporaryUpload
 from django_drf_filepond.utils import _get_file_id
 
+from api.tests.utils import read_test_file
 from data_import.celery_tasks import import_dataset
 from data_import.pipeline.catalog import RELATION_EXTRACTION
 from examples.models import Example
@@ -16,6 +17,7 @@ from projects.models import ProjectType
 from projects.tests.utils import prepare_project
 
 
+@tag("slow")
 @override_settings(MEDIA_ROOT=os.path.join(os.path.dirname(__file__), "data"))
 class TestImportData(TestCase):
     task = "Any"
@@ -36,11 +38,11 @@ class TestImportData(TestCase):
             pass
 
     def import_dataset(self, filename, file_format, task, kwargs=None):
-        file_path = str(self.data_path / filename)
+        content = read_test_file(self.data_path / filename)
         TemporaryUpload.objects.create(
             upload_id=self.upload_id,
             file_id="1",
-            file=File(open(file_path, mode="rb"), filename.split("/")[-1]),
+            file=ContentFile(content, filename.split("/")[-1]),
             upload_name=filename,
             upload_type="F",
         )
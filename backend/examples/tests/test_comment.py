@@ -43,12 +43,13 @@ class TestCommentListDocAPI(CRUDMixin):
 
 
 class TestCommentListProjectAPI(CRUDMixin):
-    def setUp(self):
-        self.project = prepare_project()
-        self.non_member = make_user()
-        self.doc = make_doc(self.project.item)
-        make_comment(self.doc, self.project.admin)
-        self.url = reverse(viewname="comment_list", args=[self.project.item.id])
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = prepare_project()
+        cls.non_member = make_user()
+        cls.doc = make_doc(cls.project.item)
+        make_comment(cls.doc, cls.project.admin)
+        cls.url = reverse(viewname="comment_list", args=[cls.project.item.id])
 
     def test_allows_project_member_to_list_comments(self):
         for member in self.project.members:
@@ -64,7 +65,7 @@ class TestCommentListProjectAPI(CRUDMixin):
     def assert_bulk_delete(self, user=None, expected=status.HTTP_403_FORBIDDEN):
         ids = [item.id for item in self.doc.comments.all()]
         if user:
-            self.client.force_login(user)
+            self.client.force_authenticate(user)
         response = self.client.delete(self.url, data={"ids": ids}, format="json")
         self.assertEqual(response.status_code, expected)
 
@@ -72,8 +73,7 @@ class TestCommentListProjectAPI(CRUDMixin):
         # Todo: Disallow non admin to delete comments.
         for member in self.project.members:
             self.assert_bulk_delete(member, status.HTTP_204_NO_CONTENT)
-            response = self.client.get(self.url)
-            self.assertEqual(response.data["count"], 0)
+            self.assertFalse(self.doc.comments.exists())
 
     def test_denies_non_project_member_to_delete_comments(self):
         self.assert_fetch(self.non_member, status.HTTP_403_FORBIDDEN)
@@ -83,13 +83,14 @@ class TestCommentListProjectAPI(CRUDMixin):
 
 
 class TestCommentDetailAPI(CRUDMixin):
-    def setUp(self):
-        self.project = prepare_project()
-        self.non_member = make_user()
-        doc = make_doc(self.project.item)
-        comment = make_comment(doc, self.project.admin)
-        self.data = {"text": "example"}
-        self.url = reverse(viewname="comment_detail", args=[self.project.item.id, comment.id])
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = prepare_project()
+        cls.non_member = make_user()
+        doc = make_doc(cls.project.item)
+        comment = make_comment(doc, cls.project.admin)
+        cls.data = {"text": "example"}
+        cls.url = reverse(viewname="comment_detail", args=[cls.project.item.id, comment.id])
 
     def test_allows_comment_owner_to_get_comment(self):
         # Todo: Allows project member to get comment.
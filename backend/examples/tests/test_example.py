@@ -70,20 +70,21 @@ class TestExampleListCollaborative(CRUDMixin):
 
 
 class TestExampleListFilter(CRUDMixin):
-    def setUp(self):
-        self.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
-        example1 = make_doc(self.project.item)
-        example2 = make_doc(self.project.item)
-        example3 = make_doc(self.project.item)
-        for member in self.project.members:
-            make_assignment(self.project.item, example1, member)
-            make_assignment(self.project.item, example2, member)
-            make_assignment(self.project.item, example3, member)
-        make_example_state(example1, self.project.admin)
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = prepare_project(task=ProjectType.DOCUMENT_CLASSIFICATION)
+        example1 = make_doc(cls.project.item)
+        example2 = make_doc(cls.project.item)
+        example3 = make_doc(cls.project.item)
+        for member in cls.project.members:
+            make_assignment(cls.project.item, example1, member)
+            make_assignment(cls.project.item, example2, member)
+            make_assignment(cls.project.item, example3, member)
+        make_example_state(example1, cls.project.admin)
+        cls.base_url = reverse(viewname="example_list", args=[cls.project.item.id])
 
     def reverse(self, query_kwargs=None):
-        base_url = reverse(viewname="example_list", args=[self.project.item.id])
-        self.url = "{}?{}".format(base_url, urlencode(query_kwargs))
+        self.url = "{}?{}".format(self.base_url, urlencode(query_kwargs))
 
     def assert_filter(self, data, user, expected):
         self.reverse(query_kwargs=data)
@@ -1,4 +1,9 @@
 from model_mommy import mommy
+from model_mommy.recipe import Recipe
+
+from examples.models import Example
+
+example_recipe = Recipe(Example)
 
 
 def make_comment(doc, user):
@@ -6,11 +11,11 @@ def make_comment(doc, user):
 
 
 def make_doc(project):
-    return mommy.make("Example", text="example", project=project)
+    return example_recipe.make(text="example", project=project)
 
 
 def make_image(project, filepath):
-    return mommy.make("Example", filename=filepath, project=project)
+    return example_recipe.make(filename=filepath, project=project)
 
 
 def make_example_state(example, user):
@@ -1,12 +1,13 @@
 import os
 
 from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
 from .utils import make_label
-from api.tests.utils import CRUDMixin
+from api.tests.utils import CRUDMixin, read_test_file
 from projects.models import ProjectType
 from projects.tests.utils import make_project, prepare_project
 from users.tests.utils import make_user
@@ -136,9 +137,9 @@ class TestLabelUploadAPI(APITestCase):
 
     def assert_upload_file(self, filename, user=None, expected_status=status.HTTP_403_FORBIDDEN):
         if user:
-            self.client.force_login(user)
-        with open(os.path.join(DATA_DIR, filename), "rb") as f:
-            response = self.client.post(self.url, data={"file": f})
+            self.client.force_authenticate(user)
+        file = SimpleUploadedFile(filename, read_test_file(os.path.join(DATA_DIR, filename)))
+        response = self.client.post(self.url, data={"file": file})
         self.assertEqual(response.status_code, expected_status)
 
     def test_allows_project_admin_to_upload_label(self):
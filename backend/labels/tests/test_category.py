@@ -1,5 +1,3 @@
-import abc
-
 from django.db import IntegrityError
 from django.test import TestCase
 from model_mommy import mommy
@@ -9,7 +7,7 @@ from projects.models import ProjectType
 from projects.tests.utils import prepare_project
 
 
-class TestCategoryLabeling(abc.ABC, TestCase):
+class TestCategoryLabeling:
     exclusive = True
     collaborative = False
 
@@ -43,7 +41,7 @@ class NonCollaborativeMixin:
         self.assertTrue(can_annotate)
 
 
-class TestExclusiveCategoryLabeling(TestCategoryLabeling, NonCollaborativeMixin):
+class TestExclusiveCategoryLabeling(TestCategoryLabeling, NonCollaborativeMixin, TestCase):
     exclusive = True
     collaborative = False
 
@@ -53,7 +51,7 @@ class TestExclusiveCategoryLabeling(TestCategoryLabeling, NonCollaborativeMixin)
         self.assertFalse(can_annotate)
 
 
-class TestNonExclusiveCategoryLabeling(TestCategoryLabeling, NonCollaborativeMixin):
+class TestNonExclusiveCategoryLabeling(TestCategoryLabeling, NonCollaborativeMixin, TestCase):
     exclusive = False
     collaborative = False
 
@@ -70,7 +68,7 @@ class CollaborativeMixin:
         self.assertFalse(can_annotate)
 
 
-class TestCollaborativeExclusiveCategoryLabeling(TestCategoryLabeling, CollaborativeMixin):
+class TestCollaborativeExclusiveCategoryLabeling(TestCategoryLabeling, CollaborativeMixin, TestCase):
     exclusive = True
     collaborative = True
 
@@ -80,7 +78,7 @@ class TestCollaborativeExclusiveCategoryLabeling(TestCategoryLabeling, Collabora
         self.assertFalse(can_annotate)
 
 
-class TestCollaborativeNonExclusiveCategoryLabeling(TestCategoryLabeling, CollaborativeMixin):
+class TestCollaborativeNonExclusiveCategoryLabeling(TestCategoryLabeling, CollaborativeMixin, TestCase):
     exclusive = False
     collaborative = True
 
@@ -1,5 +1,3 @@
-import abc
-
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 from model_mommy import mommy
@@ -10,7 +8,7 @@ from projects.models import ProjectType
 from projects.tests.utils import prepare_project
 
 
-class TestSpanLabeling(abc.ABC, TestCase):
+class TestSpanLabeling:
     overlapping = False
     collaborative = False
 
@@ -44,7 +42,7 @@ class NonCollaborativeMixin:
         self.assertTrue(can_annotate)
 
 
-class TestNonOverlappingSpanLabeling(TestSpanLabeling, NonCollaborativeMixin):
+class TestNonOverlappingSpanLabeling(TestSpanLabeling, NonCollaborativeMixin, TestCase):
     overlapping = False
     collaborative = False
 
@@ -72,7 +70,7 @@ class TestNonOverlappingSpanLabeling(TestSpanLabeling, NonCollaborativeMixin):
         self.assertFalse(can_annotate)
 
 
-class TestOverlappingSpanLabeling(TestSpanLabeling, NonCollaborativeMixin):
+class TestOverlappingSpanLabeling(TestSpanLabeling, NonCollaborativeMixin, TestCase):
     overlapping = True
     collaborative = False
 
@@ -89,7 +87,7 @@ class TestOverlappingSpanLabeling(TestSpanLabeling, NonCollaborativeMixin):
         self.assertTrue(can_annotate)
 
 
-class TestCollaborativeNonOverlappingSpanLabeling(TestSpanLabeling):
+class TestCollaborativeNonOverlappingSpanLabeling(TestSpanLabeling, TestCase):
     overlapping = False
     collaborative = True
 
@@ -117,7 +115,7 @@ class TestCollaborativeNonOverlappingSpanLabeling(TestSpanLabeling):
         self.assertFalse(can_annotate)
 
 
-class TestCollaborativeOverlappingSpanLabeling(TestSpanLabeling):
+class TestCollaborativeOverlappingSpanLabeling(TestSpanLabeling, TestCase):
     overlapping = True
     collaborative = True
 
@@ -1,5 +1,3 @@
-import abc
-
 from django.db import IntegrityError
 from django.test import TestCase
 from model_mommy import mommy
@@ -9,7 +7,7 @@ from projects.models import ProjectType
 from projects.tests.utils import prepare_project
 
 
-class TestTextLabeling(abc.ABC, TestCase):
+class TestTextLabeling:
     collaborative = False
 
     @classmethod
@@ -30,7 +28,7 @@ class TestTextLabeling(abc.ABC, TestCase):
             TextLabel(example=a.example, user=a.user, text=a.text).save()
 
 
-class TestNonCollaborativeTextLabeling(TestTextLabeling):
+class TestNonCollaborativeTextLabeling(TestTextLabeling, TestCase):
     collaborative = False
 
     def test_cannot_annotate_same_text_to_annotated_data(self):
@@ -49,7 +47,7 @@ class TestNonCollaborativeTextLabeling(TestTextLabeling):
         self.assertTrue(can_annotate)
 
 
-class TestCollaborativeTextLabeling(TestTextLabeling):
+class TestCollaborativeTextLabeling(TestTextLabeling, TestCase):
     collaborative = True
 
     def test_deny_another_user_to_annotate_same_text(self):
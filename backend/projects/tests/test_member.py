@@ -48,15 +48,14 @@ class TestMemberListAPI(CRUDMixin):
 
     def assert_bulk_delete(self, user=None, expected=status.HTTP_403_FORBIDDEN):
         if user:
-            self.client.force_login(user)
+            self.client.force_authenticate(user)
         ids = [item.id for item in self.project.item.role_mappings.all()]
         response = self.client.delete(self.url, data={"ids": ids}, format="json")
         self.assertEqual(response.status_code, expected)
 
     def test_allows_project_admin_to_remove_members(self):
         self.assert_bulk_delete(self.project.admin, status.HTTP_204_NO_CONTENT)
-        response = self.client.get(self.url)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(self.project.item.role_mappings.count(), 1)
 
     def test_denies_project_staff_to_remove_members(self):
         for member in self.project.staffs:
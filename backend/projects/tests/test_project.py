@@ -8,42 +8,77 @@ from examples.tests.utils import make_doc
 from label_types.tests.utils import make_label
 from projects.models import Member, Project, ProjectType
 from projects.tests.utils import prepare_project
-from roles.tests.utils import create_default_roles
 from users.tests.utils import make_user
 
 
-class TestProjectList(CRUDMixin):
+class TestProjectListAndDetailAPI(CRUDMixin):
     @classmethod
     def setUpTestData(cls):
-        cls.project = prepare_project()
+        cls.project = prepare_project("SequenceLabeling")
         cls.non_member = make_user()
-        cls.url = reverse(viewname="project_list")
+        cls.list_url = reverse(viewname="project_list")
+        cls.detail_url = reverse(viewname="project_detail", args=[cls.project.item.id])
+        cls.url = cls.detail_url
+        cls.data = {"description": "lorem", "resourcetype": "SequenceLabelingProject"}
 
     def test_return_projects_to_member(self):
+        self.url = self.list_url
         for member in self.project.members:
             response = self.assert_fetch(member, status.HTTP_200_OK)
             project = response.data["results"][0]
             self.assertEqual(response.data["count"], 1)
             self.assertEqual(project["id"], self.project.item.id)
 
-    def test_does_not_return_project_to_non_member(self):
+    def test_does_not_return_projects_to_non_member(self):
+        self.url = self.list_url
         response = self.assert_fetch(self.non_member, status.HTTP_200_OK)
         self.assertEqual(response.data["count"], 0)
 
+    def test_return_project_to_member(self):
+        for member in self.project.members:
+            response = self.assert_fetch(member, status.HTTP_200_OK)
+            self.assertEqual(response.data["id"], self.project.item.id)
+
+    def test_does_not_return_project_to_non_member(self):
+        self.assert_fetch(self.non_member, status.HTTP_403_FORBIDDEN)
+
+    def test_allows_admin_to_update_project(self):
+        response = self.assert_update(self.project.admin, status.HTTP_200_OK)
+        self.assertEqual(response.data["description"], self.data["description"])
+
+    def test_denies_project_staff_to_update_project(self):
+        for member in self.project.staffs:
+            self.assert_update(member, status.HTTP_403_FORBIDDEN)
+
+    def test_denies_non_member_to_update_project(self):
+        self.assert_update(self.non_member, status.HTTP_403_FORBIDDEN)
+
+    def test_allows_admin_to_delete_project(self):
+        self.assert_delete(self.project.admin, status.HTTP_204_NO_CONTENT)
+
+    def test_denies_project_staff_to_delete_project(self):
+        for member in self.project.staffs:
+            self.assert_delete(member, status.HTTP_403_FORBIDDEN)
 
-class TestProjectCreate(CRUDMixin):
+    def test_denies_non_member_to_delete_project(self):
+        self.assert_delete(self.non_member, status.HTTP_403_FORBIDDEN)
+
+
+class TestProjectCreationBase(CRUDMixin):
     @classmethod
     def setUpTestData(cls):
-        create_default_roles()
         cls.user = make_user()
         cls.url = reverse(viewname="project_list")
-        cls.data = {
-            "name": "example",
-            "project_type": "DocumentClassification",
-            "description": "example",
-            "guideline": "example",
-            "resourcetype": "TextClassificationProject",
-        }
+
+
+class TestProjectCreate(TestProjectCreationBase):
+    data = {
+        "name": "example",
+        "project_type": "DocumentClassification",
+        "description": "example",
+        "guideline": "example",
+        "resourcetype": "TextClassificationProject",
+    }
 
     def test_allows_staff_user_to_create_project(self):
         self.user.is_staff = True
@@ -67,21 +102,16 @@ class TestProjectCreate(CRUDMixin):
         self.assert_create(expected=status.HTTP_403_FORBIDDEN)
 
 
-class TestSequenceLabelingProjectCreation(CRUDMixin):
-    @classmethod
-    def setUpTestData(cls):
-        create_default_roles()
-        cls.user = make_user()
-        cls.url = reverse(viewname="project_list")
-        cls.data = {
-            "name": "example",
-            "project_type": "SequenceLabeling",
-            "description": "example",
-            "guideline": "example",
-            "allow_overlapping": True,
-            "grapheme_mode": True,
-            "resourcetype": "SequenceLabelingProject",
-        }
+class TestSequenceLabelingProjectCreation(TestProjectCreationBase):
+    data = {
+        "name": "example",
+        "project_type": "SequenceLabeling",
+        "description": "example",
+        "guideline": "example",
+        "allow_overlapping": True,
+        "grapheme_mode": True,
+        "resourcetype": "SequenceLabelingProject",
+    }
 
     def test_allows_staff_user_to_create_project(self):
         self.user.is_staff = True
@@ -91,47 +121,10 @@ class TestSequenceLabelingProjectCreation(CRUDMixin):
         self.assertEqual(response.data["grapheme_mode"], self.data["grapheme_mode"])
 
 
-class TestProjectDetailAPI(CRUDMixin):
+class TestProjectModel(TestCase):
     @classmethod
     def setUpTestData(cls):
-        cls.project = prepare_project("SequenceLabeling")
-        cls.non_member = make_user()
-        cls.url = reverse(viewname="project_detail", args=[cls.project.item.id])
-        cls.data = {"description": "lorem", "resourcetype": "SequenceLabelingProject"}
-
-    def test_return_project_to_member(self):
-        for member in self.project.members:
-            response = self.assert_fetch(member, status.HTTP_200_OK)
-            self.assertEqual(response.data["id"], self.project.item.id)
-
-    def test_does_not_return_project_to_non_member(self):
-        self.assert_fetch(self.non_member, status.HTTP_403_FORBIDDEN)
-
-    def test_allows_admin_to_update_project(self):
-        response = self.assert_update(self.project.admin, status.HTTP_200_OK)
-        self.assertEqual(response.data["description"], self.data["description"])
-
-    def test_denies_project_staff_to_update_project(self):
-        for member in self.project.staffs:
-            self.assert_update(member, status.HTTP_403_FORBIDDEN)
-
-    def test_denies_non_member_to_update_project(self):
-        self.assert_update(self.non_member, status.HTTP_403_FORBIDDEN)
-
-    def test_allows_admin_to_delete_project(self):
-        self.assert_delete(self.project.admin, status.HTTP_204_NO_CONTENT)
-
-    def test_denies_project_staff_to_delete_project(self):
-        for member in self.project.staffs:
-            self.assert_delete(member, status.HTTP_403_FORBIDDEN)
-
-    def test_denies_non_member_to_delete_project(self):
-        self.assert_delete(self.non_member, status.HTTP_403_FORBIDDEN)
-
-
-class TestProjectModel(TestCase):
-    def setUp(self):
-        self.project = prepare_project().item
+        cls.project = prepare_project().item
 
     def test_clone_project(self):
         project = self.project.clone()
@@ -6,13 +6,14 @@ from projects.tests.utils import make_tag, prepare_project
 from users.tests.utils import make_user
 
 
-class TestTagList(CRUDMixin):
+class TestTagListAPI(CRUDMixin):
     @classmethod
     def setUpTestData(cls):
         cls.project = prepare_project()
         cls.non_member = make_user()
         make_tag(project=cls.project.item)
         cls.url = reverse(viewname="tag_list", args=[cls.project.item.id])
+        cls.data = {"text": "example"}
 
     def test_return_tags_to_member(self):
         for member in self.project.members:
@@ -25,15 +26,6 @@ class TestTagList(CRUDMixin):
     def test_does_not_return_tags_to_unauthenticated_user(self):
         self.assert_fetch(expected=status.HTTP_403_FORBIDDEN)
 
-
-class TestTagCreate(CRUDMixin):
-    @classmethod
-    def setUpTestData(cls):
-        cls.project = prepare_project()
-        cls.non_member = make_user()
-        cls.url = reverse(viewname="tag_list", args=[cls.project.item.id])
-        cls.data = {"text": "example"}
-
     def test_allows_admin_to_create_tag(self):
         response = self.assert_create(self.project.admin, status.HTTP_201_CREATED)
         self.assertEqual(response.data["text"], self.data["text"])
@@ -3,8 +3,21 @@ from typing import List
 from django.conf import settings
 from model_mommy import mommy
 
-from projects.models import Member, ProjectType, Role
-from roles.tests.utils import create_default_roles
+from projects.models import (
+    BoundingBoxProject,
+    ImageCaptioningProject,
+    ImageClassificationProject,
+    IntentDetectionAndSlotFillingProject,
+    Member,
+    Project,
+    ProjectType,
+    Role,
+    SegmentationProject,
+    Seq2seqProject,
+    SequenceLabelingProject,
+    Speech2textProject,
+    TextClassificationProject,
+)
 from users.tests.utils import make_user
 
 
@@ -34,37 +47,24 @@ class ProjectData:
         return [self.approver, self.annotator]
 
 
-def assign_user_to_role(project_member, project, role_name):
-    role, _ = Role.objects.get_or_create(name=role_name)
-    if Member.objects.filter(user=project_member, project=project).exists():
-        mapping = Member.objects.get(user=project_member, project=project)
-        mapping.role = role
-        mapping.save()
-    else:
-        mapping = Member.objects.get_or_create(role_id=role.id, user_id=project_member.id, project_id=project.id)
-    return mapping
-
-
 def make_project(task: str, users: List[str], roles: List[str], collaborative_annotation=False, **kwargs):
-    create_default_roles()
-
     # create users.
     users = [make_user(name) for name in users]
 
     # create a project.
     project_model = {
-        ProjectType.DOCUMENT_CLASSIFICATION: "TextClassificationProject",
-        ProjectType.SEQUENCE_LABELING: "SequenceLabelingProject",
-        ProjectType.SEQ2SEQ: "Seq2seqProject",
-        ProjectType.SPEECH2TEXT: "Speech2TextProject",
-        ProjectType.IMAGE_CLASSIFICATION: "ImageClassificationProject",
-        ProjectType.INTENT_DETECTION_AND_SLOT_FILLING: "IntentDetectionAndSlotFillingProject",
-        ProjectType.BOUNDING_BOX: "BoundingBoxProject",
-        ProjectType.SEGMENTATION: "SegmentationProject",
-        ProjectType.IMAGE_CAPTIONING: "ImageCaptioningProject",
-    }.get(task, "Project")
-    project = mommy.make(
-        _model=project_model,
+        ProjectType.DOCUMENT_CLASSIFICATION: TextClassificationProject,
+        ProjectType.SEQUENCE_LABELING: SequenceLabelingProject,
+        ProjectType.SEQ2SEQ: Seq2seqProject,
+        ProjectType.SPEECH2TEXT: Speech2textProject,
+        ProjectType.IMAGE_CLASSIFICATION: ImageClassificationProject,
+        ProjectType.INTENT_DETECTION_AND_SLOT_FILLING: IntentDetectionAndSlotFillingProject,
+        ProjectType.BOUNDING_BOX: BoundingBoxProject,
+        ProjectType.SEGMENTATION: SegmentationProject,
+        ProjectType.IMAGE_CAPTIONING: ImageCaptioningProject,
+    }.get(task, Project)
+    project = project_model.objects.create(
+        name="example",
         project_type=task,
         collaborative_annotation=collaborative_annotation,
         created_by=users[0],
@@ -72,8 +72,10 @@ def make_project(task: str, users: List[str], roles: List[str], collaborative_an
     )
 
     # assign roles to the users.
-    for user, role in zip(users, roles):
-        assign_user_to_role(user, project, role)
+    role_by_name = {role.name: role for role in Role.objects.filter(name__in=roles)}
+    Member.objects.bulk_create(
+        [Member(user=user, project=project, role=role_by_name[role]) for user, role in zip(users, roles)]
+    )
 
     return ProjectData(item=project, members=users)
 
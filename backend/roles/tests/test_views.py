@@ -1,7 +1,6 @@
 from rest_framework import status
 from rest_framework.reverse import reverse
 
-from .utils import create_default_roles
 from api.tests.utils import CRUDMixin
 from users.tests.utils import make_user
 
@@ -9,7 +8,6 @@ from users.tests.utils import make_user
 class TestRoleAPI(CRUDMixin):
     @classmethod
     def setUpTestData(cls):
-        create_default_roles()
         cls.user = make_user()
         cls.url = reverse(viewname="roles")
 
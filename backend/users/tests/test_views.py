@@ -1,8 +1,10 @@
+from django.test import override_settings
 from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
 from .utils import make_user
+from api.tests.utils import FAST_PASSWORD_HASHERS
 
 
 class TestUserAPI(APITestCase):
@@ -12,7 +14,7 @@ class TestUserAPI(APITestCase):
         cls.url = reverse(viewname="user_list")
 
     def test_allows_authenticated_user_to_get_users(self):
-        self.client.force_login(self.user)
+        self.client.force_authenticate(self.user)
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
@@ -30,7 +32,7 @@ class TestMeAPI(APITestCase):
         cls.url = reverse(viewname="me")
 
     def test_return_own_information(self):
-        self.client.force_login(self.user)
+        self.client.force_authenticate(self.user)
         response = self.client.get(self.url)
         self.assertEqual(response.data["id"], self.user.id)
         self.assertEqual(response.data["username"], self.user.username)
@@ -40,6 +42,7 @@ class TestMeAPI(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class TestUserCreationAPI(APITestCase):
     @classmethod
     def setUpTestData(cls):
@@ -49,11 +52,11 @@ class TestUserCreationAPI(APITestCase):
         cls.payload = {"username": "hironsan", "password1": "foobarbaz", "password2": "foobarbaz"}
 
     def test_staff_can_create_user(self):
-        self.client.force_login(self.staff)
+        self.client.force_authenticate(self.staff)
         response = self.client.post(self.url, data=self.payload)
         self.assertEqual(response.data["username"], "hironsan")
 
     def test_non_staff_cannot_create_user(self):
-        self.client.force_login(self.non_staff)
+        self.client.force_authenticate(self.non_staff)
         response = self.client.post(self.url, data=self.payload)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)